@@ -1139,7 +1139,7 @@ def imposeBurnChain(burnChainStream):
         runLog.warning("Burn chain already imposed. Skipping reimposition.")
         return
     burnChainImposed = True
-    yaml = YAML(typ="rt")
+    yaml = YAML(typ="safe")
     yaml.allow_duplicate_keys = False
     burnData = yaml.load(burnChainStream)
 
@@ -1277,7 +1277,7 @@ def readMCCNuclideData():
         corresponding ID for each code.
     """
     with open(os.path.join(context.RES, "mcc-nuclides.yaml"), "r") as f:
-        yaml = YAML(typ="rt")
+        yaml = YAML(typ="safe")
         nuclides = yaml.load(f)
 
     for n in nuclides:
@@ -107,6 +107,7 @@ from typing import Tuple
 
 import numpy
 import yamlize
+from ruamel.yaml import CLoader, RoundTripLoader
 from ruamel.yaml import scalarstring
 
 from armi.utils.customExceptions import InputError
@@ -329,7 +330,9 @@ class GridBlueprint(yamlize.Object):
             if self.gridContents and symmetry.domain == geometry.DomainType.FULL_CORE:
                 nx, ny = _getGridSize(self.gridContents.keys())
                 if nx == ny and nx % 2 == 1:
-                    symmetry.isThroughCenterAssembly = True
+                    symmetry = geometry.SymmetryType(
+                        symmetry.domain, symmetry.boundary, True
+                    )
 
             isOffset = symmetry is not None and not symmetry.isThroughCenterAssembly
 
@@ -481,6 +484,12 @@ class Grids(yamlize.KeyedList):
     item_type = GridBlueprint
     key_attr = GridBlueprint.name
 
+    @classmethod
+    def load(cls, stream, roundTrip=False):
+        """Load the YAML with the same loader choice as ``Blueprints.load()``."""
+        loader = RoundTripLoader if roundTrip else CLoader
+        return super().load(stream, Loader=loader)
+
 
 def _getGridSize(idx) -> Tuple[int, int]:
     """
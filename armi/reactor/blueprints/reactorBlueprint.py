@@ -33,6 +33,7 @@ armi.reactor.blueprints.gridBlueprints : Method for storing system assembly layo
 armi.reactor.systemLayoutInput.SystemLayoutInput : Deprecated method for reading the individual
 face-map xml files.
 """
+from ruamel.yaml import CLoader, RoundTripLoader
 import tabulate
 import yamlize
 
@@ -249,6 +250,12 @@ class Systems(yamlize.KeyedList):
     item_type = SystemBlueprint
     key_attr = SystemBlueprint.name
 
+    @classmethod
+    def load(cls, stream, roundTrip=False):
+        """Load the YAML with the same loader choice as ``Blueprints.load()``."""
+        loader = RoundTripLoader if roundTrip else CLoader
+        return super().load(stream, Loader=loader)
+
 
 def summarizeMaterialData(container):
     """
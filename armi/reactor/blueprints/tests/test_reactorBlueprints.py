@@ -13,7 +13,9 @@
 # limitations under the License.
 
 """Tests for reactor blueprints."""
+import functools
 import os
+import pickle
 import unittest
 
 from armi.reactor.assemblyLists import SpentFuelPool
@@ -67,13 +69,30 @@ GEOM = """<?xml version="1.0" ?>
 """
 
 
+@functools.lru_cache(maxsize=None)
+def _parseYaml(loadMethod, yamlString):
+    """Parse each YAML string only once for this whole test module, and pickle it."""
+    return pickle.dumps(loadMethod(yamlString))
+
+
+def _loadYaml(loadMethod, yamlString):
+    """Return a fresh copy of the parsed YAML, so tests can not pollute each other.
+
+    Unpickling is roughly an order of magnitude faster than both re-parsing the YAML
+    and deep-copying the parsed objects.
+    """
+    return pickle.loads(_parseYaml(loadMethod, yamlString))
+
+
 class TestReactorBlueprints(unittest.TestCase):
     """Tests for reactor blueprints."""
 
     def setUp(self):
         # add testMethodName to avoid I/O collisions during parallel testing
-        self.systemDesigns = reactorBlueprint.Systems.load(CORE_BLUEPRINT)
-        self.gridDesigns = gridBlueprint.Grids.load(GRIDS.format(self._testMethodName))
+        self.systemDesigns = _loadYaml(reactorBlueprint.Systems.load, CORE_BLUEPRINT)
+        self.gridDesigns = _loadYaml(
+            gridBlueprint.Grids.load, GRIDS.format(self._testMethodName)
+        )
 
     def test_simple_read(self):
         self.assertAlmostEqual(self.systemDesigns["sfp"].origin.y, 12.1)
@@ -89,8 +108,9 @@ class TestReactorBlueprints(unittest.TestCase):
         newSettings = {"geomFile": self._testMethodName + "geometry.xml"}
         cs = cs.modified(newSettings=newSettings)
 
-        bp = blueprints.Blueprints.load(
-            test_customIsotopics.TestCustomIsotopics.yamlString
+        bp = _loadYaml(
+            blueprints.Blueprints.load,
+            test_customIsotopics.TestCustomIsotopics.yamlString,
         )
         bp.systemDesigns = self.systemDesigns
         bp.gridDesigns = self.gridDesigns
@@ -17,6 +17,7 @@ This module contains constants and enumerations that are useful for describing s
 geometry.
 """
 import enum
+import functools
 from typing import Union, Optional
 
 
@@ -72,19 +73,9 @@ class GeomType(enum.Enum):
     @classmethod
     def fromStr(cls, geomStr: str) -> "GeomType":
         # case-insensitive
-        canonical = geomStr.lower().strip()
-        if canonical in (HEX, HEX_CORNERS_UP):
-            # corners-up is used to rotate grids, but shouldn't be needed after the grid
-            # is appropriately oriented, so we collapse to HEX in the enumeration. If
-            # there is a good reason to make corners-up HEX its own geom type, we will
-            # need to figure out how to design around that.
-            return cls.HEX
-        elif canonical == CARTESIAN:
-            return cls.CARTESIAN
-        elif canonical == RZT:
-            return cls.RZT
-        elif canonical == RZ:
-            return cls.RZ
+        geomType = _GEOM_TYPES_BY_STR.get(geomStr.lower().strip())
+        if geomType is not None:
+            return geomType
 
         # use the original geomStr with preserved capitalization for better
         # error-finding.
@@ -141,18 +132,9 @@ class DomainType(enum.Enum):
     def fromStr(cls, shapeStr: str) -> "DomainType":
         # case-insensitive
         canonical = shapeStr.lower().strip()
-        if canonical == FULL_CORE:
-            return cls.FULL_CORE
-        elif canonical == THIRD_CORE:
-            return cls.THIRD_CORE
-        elif canonical == QUARTER_CORE:
-            return cls.QUARTER_CORE
-        elif canonical == EIGHTH_CORE:
-            return cls.EIGHTH_CORE
-        elif canonical == SIXTEENTH_CORE:
-            return cls.SIXTEENTH_CORE
-        elif canonical == "":
-            return cls.NULL
+        domainType = _DOMAIN_TYPES_BY_STR.get(canonical)
+        if domainType is not None:
+            return domainType
 
         errorMsg = "{} is not a valid domain option. Valid domain options are:".format(
             str(canonical)
@@ -232,12 +214,9 @@ class BoundaryType(enum.Enum):
     def fromStr(cls, symmetryStr: str) -> "BoundaryType":
         # case-insensitive
         canonical = symmetryStr.lower().strip()
-        if canonical == NO_SYMMETRY:
-            return cls.NO_SYMMETRY
-        elif canonical == PERIODIC:
-            return cls.PERIODIC
-        elif canonical == REFLECTIVE:
-            return cls.REFLECTIVE
+        boundaryType = _BOUNDARY_TYPES_BY_STR.get(canonical)
+        if boundaryType is not None:
+            return boundaryType
 
         errorMsg = (
             "{} is not a valid boundary option. Valid boundary options are:".format(
@@ -278,8 +257,13 @@ class SymmetryType:
     in enumerations and using them to check symmetry conditions, while also providing
     a standard string representation of the options that facilitates interfacing with
     yaml and/or the database nicely.
+
+    SymmetryType objects are immutable value objects, so the results of ``fromStr()``
+    are cached and shared between callers.
     """
 
+    __slots__ = ("_domain", "_boundary", "_isThroughCenterAssembly")
+
     VALID_SYMMETRY = {
         (DomainType.FULL_CORE, BoundaryType.NO_SYMMETRY, False),
         (DomainType.FULL_CORE, BoundaryType.NO_SYMMETRY, True),
@@ -306,9 +290,9 @@ class SymmetryType:
         boundaryType: "BoundaryType" = BoundaryType.PERIODIC,
         throughCenterAssembly: Optional[bool] = False,
     ):
-        self.domain = domainType
-        self.boundary = boundaryType
-        self.isThroughCenterAssembly = throughCenterAssembly
+        self._domain = domainType
+        self._boundary = boundaryType
+        self._isThroughCenterAssembly = throughCenterAssembly
 
         if not self.checkValidSymmetry():
             errorMsg = "{} is not a valid symmetry option. Valid symmetry options are: ".format(
@@ -319,6 +303,31 @@ class SymmetryType:
             )
             raise ValueError(errorMsg)
 
+    def __getstate__(self):
+        return (self._domain, self._boundary, self._isThroughCenterAssembly)
+
+    def __setstate__(self, state):
+        if isinstance(state, dict):
+            # pickles made before SymmetryType had __slots__ hold the instance __dict__
+            state = (
+                state["domain"],
+                state["boundary"],
+                state["isThroughCenterAssembly"],
+            )
+        self._domain, self._boundary, self._isThroughCenterAssembly = state
+
+    @property
+    def domain(self) -> "DomainType":
+        return self._domain
+
+    @property
+    def boundary(self) -> "BoundaryType":
+        return self._boundary
+
+    @property
+    def isThroughCenterAssembly(self) -> bool:
+        return self._isThroughCenterAssembly
+
     @classmethod
     def createValidSymmetryStrings(cls):
         """Create a list of valid symmetry strings based on the set of tuples in VALID_SYMMETRY."""
@@ -328,6 +337,7 @@ class SymmetryType:
         ]
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def fromStr(cls, symmetryString: str) -> "SymmetryType":
         """Construct a SymmetryType object from a valid string."""
         canonical = symmetryString.lower().strip()
@@ -419,9 +429,8 @@ def checkValidGeomSymmetryCombo(
     Return a boolean indicating the outcome of the check.
     """
     symmetry = SymmetryType.fromAny(symmetryInput)
-    if (symmetry.domain, symmetry.boundary) in VALID_GEOM_SYMMETRY[
-        GeomType.fromAny(geomType)
-    ]:
+    combo = (GeomType.fromAny(geomType), symmetry.domain, symmetry.boundary)
+    if combo in _VALID_GEOM_SYMMETRY_COMBOS:
         return True
     else:
         raise ValueError(
@@ -473,6 +482,13 @@ VALID_GEOM_SYMMETRY = {
     GeomType.RZ: [(DomainType.FULL_CORE, BoundaryType.NO_SYMMETRY)],
 }
 
+# flattened copy of VALID_GEOM_SYMMETRY, for fast lookups of (geom, domain, boundary)
+_VALID_GEOM_SYMMETRY_COMBOS = frozenset(
+    (geom, domain, boundary)
+    for geom, combos in VALID_GEOM_SYMMETRY.items()
+    for domain, boundary in combos
+)
+
 FULL_CORE = "full"
 THIRD_CORE = "third"
 QUARTER_CORE = "quarter"
@@ -487,3 +503,29 @@ THROUGH_CENTER_ASSEMBLY = "through center"
 geomTypes = {HEX, CARTESIAN, RZT, RZ}
 domainTypes = {FULL_CORE, THIRD_CORE, QUARTER_CORE, EIGHTH_CORE, SIXTEENTH_CORE}
 boundaryTypes = {NO_SYMMETRY, PERIODIC, REFLECTIVE}
+
+# lookup tables for the fromStr() methods, keyed on the canonical (lower case) strings
+_GEOM_TYPES_BY_STR = {
+    HEX: GeomType.HEX,
+    # corners-up is used to rotate grids, but shouldn't be needed after the grid is
+    # appropriately oriented, so we collapse to HEX in the enumeration. If there is a
+    # good reason to make corners-up HEX its own geom type, we will need to figure out
+    # how to design around that.
+    HEX_CORNERS_UP: GeomType.HEX,
+    CARTESIAN: GeomType.CARTESIAN,
+    RZT: GeomType.RZT,
+    RZ: GeomType.RZ,
+}
+_DOMAIN_TYPES_BY_STR = {
+    FULL_CORE: DomainType.FULL_CORE,
+    THIRD_CORE: DomainType.THIRD_CORE,
+    QUARTER_CORE: DomainType.QUARTER_CORE,
+    EIGHTH_CORE: DomainType.EIGHTH_CORE,
+    SIXTEENTH_CORE: DomainType.SIXTEENTH_CORE,
+    "": DomainType.NULL,
+}
+_BOUNDARY_TYPES_BY_STR = {
+    NO_SYMMETRY: BoundaryType.NO_SYMMETRY,
+    PERIODIC: BoundaryType.PERIODIC,
+    REFLECTIVE: BoundaryType.REFLECTIVE,
+}
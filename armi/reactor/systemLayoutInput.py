@@ -274,7 +274,7 @@ class SystemLayoutInput:
         This is intended to replace the XML format as we converge on
         consistent inputs.
         """
-        yaml = YAML()
+        yaml = YAML(typ="safe")
         yaml.allow_duplicate_keys = False
         tree = yaml.load(stream)
         tree = INPUT_SCHEMA(tree)
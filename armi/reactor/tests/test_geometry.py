@@ -15,6 +15,7 @@
 """Tests the geometry (loading input) file."""
 import io
 import os
+import pickle
 import unittest
 
 from armi.reactor import geometry
@@ -107,6 +108,29 @@ class TestSymmetryType(unittest.TestCase):
         with self.assertRaises(ValueError):
             geometry.SymmetryType.fromStr("what even is this?")
 
+    def test_immutable(self):
+        # SymmetryType objects are immutable, so the same string gives the same object
+        st = geometry.SymmetryType.fromStr("third periodic")
+        self.assertIs(st, geometry.SymmetryType.fromStr("third periodic"))
+        with self.assertRaises(AttributeError):
+            st.domain = geometry.DomainType.FULL_CORE
+
+        # but they can still be copied
+        st2 = pickle.loads(pickle.dumps(st))
+        self.assertIsNot(st, st2)
+        self.assertEqual(st, st2)
+
+        # pickles made before SymmetryType was immutable hold a __dict__ state
+        st3 = geometry.SymmetryType.__new__(geometry.SymmetryType)
+        st3.__setstate__(
+            {
+                "domain": st.domain,
+                "boundary": st.boundary,
+                "isThroughCenterAssembly": st.isThroughCenterAssembly,
+            }
+        )
+        self.assertEqual(st, st3)
+
     def test_fromAny(self):
         st = geometry.SymmetryType.fromAny("eighth reflective through center assembly")
         self.assertTrue(st.isThroughCenterAssembly)
@@ -44,11 +44,14 @@ Or change the log level the same way:
 
     runLog.setVerbosity('debug')
 """
-from glob import glob
+import bisect
 import collections
+import functools
+import heapq
 import logging
 import operator
 import os
+import shutil
 import sys
 import time
 
@@ -60,6 +63,7 @@ _ADD_LOG_METHOD_STR = """def {0}(self, message, *args, **kws):
     if self.isEnabledFor({1}):
         self._log({1}, message, args, **kws)
 logging.Logger.{0} = {0}"""
+COPY_BUFFER_SIZE = 1024 * 1024
 LOG_DIR = os.path.join(os.getcwd(), "logs")
 OS_SECONDS_TIMEOUT = 2 * 60
 SEP = "|"
@@ -115,7 +119,7 @@ class _RunLog:
             If this is zero, we are in the parent process, otherwise child process.
             This should not be adjusted after instantiation.
         """
-        rank = "" if mpiRank == 0 else "-{:>03d}".format(mpiRank)
+        rank = "" if mpiRank == 0 else f"-{mpiRank:>03d}"
 
         # NOTE: using ordereddict so we can get right order of options in GUI
         return collections.OrderedDict(
@@ -132,9 +136,13 @@ class _RunLog:
         )
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def getWhiteSpace(mpiRank):
         """Helper method to build the white space used to left-adjust the log lines.
 
+        This is called for every log record, so the result is cached per MPI rank,
+        rather than rebuilding the log levels dictionary every time.
+
         Parameters
         ----------
         mpiRank : int
@@ -144,6 +152,18 @@ class _RunLog:
         logLevels = _RunLog.getLogLevels(mpiRank)
         return " " * len(max([ll[1] for ll in logLevels.values()]))
 
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def getNewLineIndent(mpiRank):
+        """The string that replaces each newline, to left-adjust multi-line log messages.
+
+        Parameters
+        ----------
+        mpiRank : int
+            If this is zero, we are in the parent process, otherwise child process.
+        """
+        return "\n" + _RunLog.getWhiteSpace(mpiRank)
+
     def _setLogLevels(self):
         """Here we fill the logLevels dict with custom strings that depend on the MPI rank."""
         self.logLevels = self.getLogLevels(self._mpiRank)
@@ -175,12 +195,16 @@ class _RunLog:
         In this situation, we do the mangling needed to get the log level to the correct number.
         And we do some custom string manipulation so we can handle de-duplicating warnings.
         """
-        if not os.path.exists(LOG_DIR):
-            createLogDir(LOG_DIR)
-
         # Determine the log level: users can optionally pass in custom strings ("debug")
         msgLevel = msgType if isinstance(msgType, int) else self.logLevels[msgType][0]
 
+        # exit early for messages below the current verbosity, which is the common case
+        if not self.logger.isEnabledFor(msgLevel):
+            return
+
+        if not os.path.exists(LOG_DIR):
+            createLogDir(LOG_DIR)
+
         # If this is a special "don't duplicate me" string, we need to add that info to the msg temporarily
         msg = str(msg)
 
@@ -203,9 +227,15 @@ class _RunLog:
         if dupsFilter:
             dupsFilter.singleMessageCounts.clear()
 
-    def warningReport(self):
-        """Summarize all warnings for the run."""
-        self.logger.warningReport()
+    def warningReport(self, top=None):
+        """Summarize all warnings for the run.
+
+        Parameters
+        ----------
+        top : int, optional
+            If provided, only report this many of the most frequent warnings.
+        """
+        self.logger.warningReport(top=top)
 
     def getLogVerbosityRank(self, level):
         """Return integer verbosity rank given the string verbosity name."""
@@ -243,15 +273,9 @@ class _RunLog:
             # The logging module does strange things if you set the log level to something other than DEBUG, INFO, etc
             # So, if someone tries, we HAVE to set the log level at a canonical value.
             # Otherwise, nearly all log statements will be silently dropped.
-            if level in self._logLevelNumbers:
-                self._verbosity = level
-            elif level < self._logLevelNumbers[0]:
-                self._verbosity = self._logLevelNumbers[0]
-            else:
-                for i in range(len(self._logLevelNumbers) - 1, -1, -1):
-                    if level >= self._logLevelNumbers[i]:
-                        self._verbosity = self._logLevelNumbers[i]
-                        break
+            # So we round down to the nearest canonical level, or up to the lowest one.
+            i = bisect.bisect_right(self._logLevelNumbers, level)
+            self._verbosity = self._logLevelNumbers[max(i - 1, 0)]
         else:
             raise TypeError("Invalid verbosity rank {}.".format(level))
 
@@ -288,9 +312,7 @@ class _RunLog:
             )
             self.stderrLogger = logging.getLogger(STDERR_LOGGER_NAME)
             h = logging.FileHandler(filePath, delay=True)
-            fmt = "%(message)s"
-            form = logging.Formatter(fmt)
-            h.setFormatter(form)
+            h.setFormatter(_STDERR_FORMATTER)
             h.setLevel(logging.WARNING)
             self.stderrLogger.handlers = [h]
             self.stderrLogger.setLevel(logging.WARNING)
@@ -343,8 +365,9 @@ def concatenateLogs(logDir=None):
     if logDir is None:
         logDir = LOG_DIR
 
-    # find all the logging-module-based log files
-    stdoutFiles = sorted(glob(os.path.join(logDir, "*.stdout")))
+    # find all the logging-module-based log files, and their sizes, in one directory scan
+    logSizes = _getLogFileSizes(logDir)
+    stdoutFiles = sorted(path for path in logSizes if path.endswith(".stdout"))
     if not len(stdoutFiles):
         info("No log files found to concatenate.")
 
@@ -377,19 +400,18 @@ def concatenateLogs(logDir=None):
         for stdoutName in stdoutFiles:
             # NOTE: If the log file name format changes, this will need to change.
             rank = int(stdoutName.split(".")[-2])
-            with open(stdoutName, "r") as logFile:
-                data = logFile.read()
-                # only write if there's something to write
-                if data:
-                    rankId = "\n{0} RANK {1:03d} STDOUT {2}\n".format(
-                        "-" * 10, rank, "-" * 60
-                    )
-                    if rank == 0:
-                        print(rankId, file=sys.stdout)
-                        print(data, file=sys.stdout)
-                    else:
-                        workerLog.write(rankId)
-                        workerLog.write(data)
+            # only write if there's something to write
+            if logSizes[stdoutName]:
+                rankId = "\n{0} RANK {1:03d} STDOUT {2}\n".format(
+                    "-" * 10, rank, "-" * 60
+                )
+                if rank == 0:
+                    print(rankId, file=sys.stdout)
+                    _copyLogFile(stdoutName, sys.stdout)
+                    print("", file=sys.stdout)
+                else:
+                    workerLog.write(rankId)
+                    _copyLogFile(stdoutName, workerLog)
             try:
                 os.remove(stdoutName)
             except OSError:
@@ -397,22 +419,40 @@ def concatenateLogs(logDir=None):
 
             # then print the stderr messages for that child process
             stderrName = stdoutName[:-3] + "err"
-            if os.path.exists(stderrName):
-                with open(stderrName) as logFile:
-                    data = logFile.read()
-                    if data:
-                        # only write if there's something to write.
-                        rankId = "\n{0} RANK {1:03d} STDERR {2}\n".format(
-                            "-" * 10, rank, "-" * 60
-                        )
-                        print(rankId, file=sys.stderr)
-                        print(data, file=sys.stderr)
+            if stderrName in logSizes:
+                if logSizes[stderrName]:
+                    # only write if there's something to write.
+                    rankId = "\n{0} RANK {1:03d} STDERR {2}\n".format(
+                        "-" * 10, rank, "-" * 60
+                    )
+                    print(rankId, file=sys.stderr)
+                    _copyLogFile(stderrName, sys.stderr)
+                    print("", file=sys.stderr)
                 try:
                     os.remove(stderrName)
                 except OSError:
                     warning("Could not delete {0}".format(stderrName))
 
 
+def _getLogFileSizes(logDir):
+    """Map the path of every stdout/stderr log file in a directory to its size in bytes."""
+    try:
+        with os.scandir(logDir) as entries:
+            return {
+                entry.path: entry.stat().st_size
+                for entry in entries
+                if entry.name.endswith((".stdout", ".stderr"))
+            }
+    except FileNotFoundError:
+        return {}
+
+
+def _copyLogFile(filePath, outStream):
+    """Stream a log file into an output stream, without reading the whole file into memory."""
+    with open(filePath, "r") as logFile:
+        shutil.copyfileobj(logFile, outStream, COPY_BUFFER_SIZE)
+
+
 # Here are all the module-level functions that should be used for most outputs.
 # They use the Log object behind the scenes.
 def raw(msg):
@@ -448,8 +488,8 @@ def header(msg, single=False, label=None):
     LOG.log("header", msg, single=single, label=label)
 
 
-def warningReport():
-    LOG.warningReport()
+def warningReport(top=None):
+    LOG.warningReport(top=top)
 
 
 def setVerbosity(level):
@@ -470,8 +510,8 @@ class DeduplicationFilter(logging.Filter):
 
     def __init__(self, *args, **kwargs):
         logging.Filter.__init__(self, *args, **kwargs)
-        self.singleMessageCounts = {}
-        self.singleWarningMessageCounts = {}
+        self.singleMessageCounts = collections.Counter()
+        self.singleWarningMessageCounts = collections.Counter()
 
     def filter(self, record):
         # determine if this is a "do not duplicate" message
@@ -485,27 +525,48 @@ class DeduplicationFilter(logging.Filter):
                 label = getattr(record, "label", msg)
                 # the "label" default is None, which needs to be replaced
                 label = msg if label is None else label
-
-                if label not in self.singleWarningMessageCounts:
-                    self.singleWarningMessageCounts[label] = 1
-                else:
-                    self.singleWarningMessageCounts[label] += 1
-                    return False
+                counts = self.singleWarningMessageCounts
             else:
                 # in sub-warning cases, hash the msg, for a faster label lookup
                 label = hash(msg)
-                if label not in self.singleMessageCounts:
-                    self.singleMessageCounts[label] = 1
-                else:
-                    self.singleMessageCounts[label] += 1
-                    return False
+                counts = self.singleMessageCounts
+
+            counts[label] += 1
+            if counts[label] > 1:
+                return False
 
         # Handle some special string-mangling we want to do, for multi-line messages
-        whiteSpace = _RunLog.getWhiteSpace(context.MPI_RANK)
-        record.msg = msg.rstrip().replace("\n", "\n" + whiteSpace)
+        record.msg = _cleanMsg(msg, context.MPI_RANK)
         return True
 
 
+def _cleanMsg(msg, mpiRank):
+    """Strip trailing white space from a message, and left-adjust it if it is multi-line."""
+    if "\n" not in msg:
+        return msg.rstrip()
+
+    return msg.rstrip().replace("\n", _RunLog.getNewLineIndent(mpiRank))
+
+
+class RunLogFormatter(logging.Formatter):
+    """
+    A fast formatter for the ``RunLogger.FMT`` log line format.
+
+    Every log line is just the level name followed by the message, so we can skip the
+    generic %-style string formatting the standard library does for every record.
+    """
+
+    def __init__(self):
+        logging.Formatter.__init__(self, RunLogger.FMT)
+
+    def format(self, record):
+        # exception and stack traces still need the standard library handling
+        if record.exc_info or record.stack_info:
+            return logging.Formatter.format(self, record)
+
+        return record.levelname + record.getMessage()
+
+
 class RunLogger(logging.Logger):
     """Custom Logger to support our specific desires.
 
@@ -578,8 +639,7 @@ class RunLogger(logging.Logger):
             handler.setLevel(logging.WARNING)
             self.setLevel(logging.WARNING)
 
-        form = logging.Formatter(RunLogger.FMT)
-        handler.setFormatter(form)
+        handler.setFormatter(_RUN_LOG_FORMATTER)
         self.addHandler(handler)
 
     def log(self, msgType, msg, single=False, label=None, **kwargs):
@@ -653,8 +713,15 @@ class RunLogger(logging.Logger):
 
         return None
 
-    def warningReport(self):
-        """Summarize all warnings for the run."""
+    def warningReport(self, top=None):
+        """Summarize all warnings for the run.
+
+        Parameters
+        ----------
+        top : int, optional
+            If provided, only report this many of the most frequent warnings. This
+            avoids sorting every warning, for runs with a huge number of distinct ones.
+        """
         self.info("----- Final Warning Count --------")
         self.info("  {0:^10s}   {1:^25s}".format("COUNT", "LABEL"))
 
@@ -665,10 +732,16 @@ class RunLogger(logging.Logger):
             self.info("------------------------------------")
             return
 
-        # sort by labcollections.defaultdict(lambda: 1)
-        for label, count in sorted(
-            dupsFilter.singleWarningMessageCounts.items(), key=operator.itemgetter(1)
-        ):
+        # sort by count, from least to most frequent
+        warningCounts = dupsFilter.singleWarningMessageCounts.items()
+        if top is None:
+            warningCounts = sorted(warningCounts, key=operator.itemgetter(1))
+        else:
+            warningCounts = heapq.nlargest(
+                top, warningCounts, key=operator.itemgetter(1)
+            )[::-1]
+
+        for label, count in warningCounts:
             self.info("  {0:^10s}   {1:^25s}".format(str(count), str(label)))
         self.info("------------------------------------")
 
@@ -696,6 +769,10 @@ class NullLogger(RunLogger):
         pass
 
 
+# Formatters hold no per-handler state, so all of our handlers can share these
+_RUN_LOG_FORMATTER = RunLogFormatter()
+_STDERR_FORMATTER = logging.Formatter("%(message)s")
+
 # Setting the default logging class to be ours
 logging.RunLogger = RunLogger
 logging.setLoggerClass(RunLogger)
@@ -707,15 +784,14 @@ def createLogDir(logDir: str = None) -> None:
     if logDir is None:
         logDir = LOG_DIR
 
-    # create the directory
-    if not os.path.exists(logDir):
-        try:
-            os.makedirs(logDir)
-        except FileExistsError:
-            # If we hit this race condition, we still win.
-            return
+    # the usual case is the directory already exists
+    if os.path.exists(logDir):
+        return
+
+    # create the directory; exist_ok means we still win if another process races us
+    os.makedirs(logDir, exist_ok=True)
 
-    # potentially, wait for directory to be created
+    # potentially, wait for directory to be created (e.g. on slow network file systems)
     secondsWait = 0.5
     loopCounter = 0
     while not os.path.exists(logDir):
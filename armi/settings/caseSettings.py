@@ -408,7 +408,7 @@ class Settings:
         # We do not want to load these as settings, but just grab the dictionary straight
         # from the settings file to know which settings are user-defined
         with open(fPath, "r") as stream:
-            yaml = YAML()
+            yaml = YAML(typ="safe")
             yaml.allow_duplicate_keys = False
             tree = yaml.load(stream)
             userSettings = tree[settingsIO.Roots.CUSTOM]
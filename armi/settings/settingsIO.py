@@ -215,7 +215,7 @@ class SettingsReader:
         from armi.physics.thermalHydraulics import const  # avoid circular import
         from armi.settings.fwSettings.globalSettings import CONF_VERSIONS
 
-        yaml = YAML(typ="rt")
+        yaml = YAML(typ="safe")
         yaml.allow_duplicate_keys = False
         tree = yaml.load(stream)
         if "settings" not in tree:
@@ -410,9 +410,10 @@ def prompt(statement, question, *options):
             responses.append("N")
 
         # Use the logger tools to handle user prompts (runLog supports this).
+        questionLine = "{} ({}): ".format(question, ", ".join(responses))
         while response not in responses:
             runLog.LOG.log("prompt", statement)
-            runLog.LOG.log("prompt", "{} ({}): ".format(question, ", ".join(responses)))
+            runLog.LOG.log("prompt", questionLine)
             response = sys.stdin.readline().strip().upper()
 
         if response == "CANCEL":
@@ -24,6 +24,16 @@ from armi.utils.directoryChangers import TemporaryDirectoryChanger
 
 
 class TestRunLog(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # create the log directory once, rather than checking for it in every test
+        runLog.createLogDir()
+
+        # the verbosity ranks only depend on the log levels, so look them up once
+        log = runLog._RunLog(1)
+        cls.debugRank = log.getLogVerbosityRank("debug")
+        cls.errorRank = log.getLogVerbosityRank("error")
+
     def test_setVerbosityFromInteger(self):
         """Test that the log verbosity can be set with an integer.
 
@@ -31,9 +41,7 @@ class TestRunLog(unittest.TestCase):
             :id: T_ARMI_LOG0
             :tests: R_ARMI_LOG
         """
-        log = runLog._RunLog(1)
-        expectedStrVerbosity = "debug"
-        verbosityRank = log.getLogVerbosityRank(expectedStrVerbosity)
+        verbosityRank = self.debugRank
         runLog.setVerbosity(verbosityRank)
         self.assertEqual(verbosityRank, runLog.getVerbosity())
         self.assertEqual(verbosityRank, logging.DEBUG)
@@ -46,10 +54,8 @@ class TestRunLog(unittest.TestCase):
             :id: T_ARMI_LOG1
             :tests: R_ARMI_LOG
         """
-        log = runLog._RunLog(1)
-        expectedStrVerbosity = "error"
-        verbosityRank = log.getLogVerbosityRank(expectedStrVerbosity)
-        runLog.setVerbosity(expectedStrVerbosity)
+        verbosityRank = self.errorRank
+        runLog.setVerbosity("error")
         self.assertEqual(verbosityRank, runLog.getVerbosity())
         self.assertEqual(verbosityRank, logging.ERROR)
 
@@ -78,7 +84,6 @@ class TestRunLog(unittest.TestCase):
         # init the _RunLog object
         log = runLog.LOG = runLog._RunLog(0)
         log.startLog("test_parentRunLogging")
-        runLog.createLogDir(0)
         log.setVerbosity(logging.INFO)
 
         # divert the logging to a stream, to make testing easier
@@ -109,6 +114,20 @@ class TestRunLog(unittest.TestCase):
         self.assertGreater(space1, space0)
         self.assertEqual(space1, space9)
 
+    def test_getNewLineIndent(self):
+        for rank in (0, 1):
+            indent = runLog._RunLog.getNewLineIndent(rank)
+            self.assertEqual(indent, "\n" + runLog._RunLog.getWhiteSpace(rank))
+
+    def test_cleanMsg(self):
+        whiteSpace = runLog._RunLog.getWhiteSpace(0)
+        msg = runLog._cleanMsg("first\nsecond  \n", 0)
+        self.assertEqual(msg, "first\n" + whiteSpace + "second")
+
+        # single-line messages only lose their trailing white space
+        msg = runLog._cleanMsg("single line  ", 0)
+        self.assertEqual(msg, "single line")
+
     def test_warningReport(self):
         """A simple test of the warning tracking and reporting logic.
 
@@ -119,7 +138,6 @@ class TestRunLog(unittest.TestCase):
         # create the logger and do some logging
         log = runLog.LOG = runLog._RunLog(321)
         log.startLog("test_warningReport")
-        runLog.createLogDir(0)
 
         # divert the logging to a stream, to make testing easier
         stream = StringIO()
@@ -156,6 +174,38 @@ class TestRunLog(unittest.TestCase):
         self.assertIsNone(log.getDuplicatesFilter())
         log.logger = backupLog
 
+    def test_warningReportTop(self):
+        """Test that the warning report can be limited to the most frequent warnings."""
+        # restore the global logger afterwards, so later tests do not log as rank 322
+        self.addCleanup(setattr, runLog, "LOG", runLog.LOG)
+        log = runLog.LOG = runLog._RunLog(322)
+        log.startLog("test_warningReportTop")
+
+        # divert the logging to a stream, to make testing easier
+        stream = StringIO()
+        handler = logging.StreamHandler(stream)
+        log.logger.handlers = [handler]
+
+        # log some things
+        log.setVerbosity(logging.INFO)
+        for i, label in enumerate(["warnedOnce", "warnedTwice", "warnedThrice"]):
+            for _ in range(i + 1):
+                log.log("warning", label, single=True, label=None)
+
+        # only report the top two warnings
+        stream.seek(0)
+        stream.truncate(0)
+        log.warningReport(top=2)
+        runLog.close(1)
+        runLog.close(0)
+
+        # test what was logged
+        streamVal = stream.getvalue()
+        self.assertNotIn("warnedOnce", streamVal, msg=streamVal)
+        self.assertIn("warnedTwice", streamVal, msg=streamVal)
+        self.assertIn("warnedThrice", streamVal, msg=streamVal)
+        self.assertLess(streamVal.index("warnedTwice"), streamVal.index("warnedThrice"))
+
     def test_warningReportInvalid(self):
         """A test of warningReport in an invalid situation.
 
@@ -167,7 +217,6 @@ class TestRunLog(unittest.TestCase):
         testName = "test_warningReportInvalid"
         log = runLog.LOG = runLog._RunLog(323)
         log.startLog(testName)
-        runLog.createLogDir(0)
 
         # divert the logging to a stream, to make testing easier
         stream = StringIO()
@@ -217,7 +266,6 @@ class TestRunLog(unittest.TestCase):
 
         # start the logging for real
         log.startLog("test_closeLogging")
-        runLog.createLogDir()
         validate_loggers(log)
 
         # close() and test that we have correctly nullified our loggers
@@ -406,6 +454,11 @@ class TestRunLog(unittest.TestCase):
             # verify output
             combinedLogFile = os.path.join(logDir, "runLogTest-mpi.log")
             self.assertTrue(os.path.exists(combinedLogFile))
+            with open(combinedLogFile, "r") as f:
+                combinedLog = f.read()
+            self.assertIn("RANK 001 STDOUT", combinedLog)
+            self.assertIn("hello other world", combinedLog)
+            self.assertNotIn("hello world", combinedLog)
             self.assertFalse(os.path.exists(stdoutFile1))
             self.assertFalse(os.path.exists(stdoutFile2))
             self.assertFalse(os.path.exists(stderrFile))
@@ -448,6 +501,16 @@ class TestRunLogger(unittest.TestCase):
         self.rl.allowStopDuplicates()
         self.assertEqual(len(self.rl.filters), 1)
 
+    def test_runLogFormatter(self):
+        form = runLog.RunLogFormatter()
+        record = logging.LogRecord("test", logging.INFO, "", 0, "hi %s", ("you",), None)
+        self.assertEqual(
+            form.format(record), logging.getLevelName(logging.INFO) + "hi you"
+        )
+        self.assertEqual(
+            form.format(record), logging.Formatter(runLog.RunLogger.FMT).format(record)
+        )
+
     def test_write(self):
         """Test that we can write text to the logger output stream.
 
@@ -14,9 +14,9 @@
 
 """Module of utilities to help dealing with iterable objects in Python."""
 from itertools import tee, chain
-import struct
 
 from six.moves import filterfalse, map, xrange, filter
+import numpy
 
 
 def flatten(lst):
@@ -27,14 +27,15 @@ def flatten(lst):
     >>> flatten([[1,2,3,4],[5,6,7,8],[9,10]])
     [1,2,3,4,5,6,7,8,9,10]
     """
-    return [item for sublist in lst for item in sublist]
+    return list(chain.from_iterable(lst))
 
 
 def chunk(lst, n):
     r"""Returns a generator object that yields lenght-`n` chunks of `lst`.
 
     The last chunk may have a length less than `n` if `n` doesn't divide
-    `len(lst)`.
+    `len(lst)`. Each chunk is a slice of `lst`, so chunks of a numpy array are
+    views into the original data, not copies.
 
     Examples
     --------
@@ -65,7 +66,10 @@ def split(a, n, padWith=()):
 
     Returns
     -------
-    chunked : list[len=n] of lists
+    chunked : list[len=n] of lists, or list[len=n] of numpy arrays
+        If `a` is a numpy array, each chunk is a view into `a` along its first axis
+        (so a 2-D array is split into 2-D blocks of rows), rather than a list.
+        Padded entries are `padWith`, in either case.
 
     Examples
     --------
@@ -75,11 +79,14 @@ def split(a, n, padWith=()):
     >>> split([0,1,2], 5, padWith=None)
      [[0], [1], [2], None, None]
     """
+    assert n > 0, "Cannot chunk into less than 1 chunks. You requested {0}".format(n)
+
+    if isinstance(a, numpy.ndarray):
+        return [c if len(c) else padWith for c in numpy.array_split(a, n)]
+
     a = list(a)  # in case `a` is not list-like
     N = len(a)
 
-    assert n > 0, "Cannot chunk into less than 1 chunks. You requested {0}".format(n)
-
     k, m = divmod(N, n)
     chunked = [
         a[i * k + min(i, m) : (i + 1) * k + min(i + 1, m)] or padWith for i in xrange(n)
@@ -93,31 +100,51 @@ def unpackBinaryStrings(binaryRow):
         raise ValueError(
             "Cannot unpack binary strings from misformatted row. Expected chunks of size 8."
         )
-    return [(struct.unpack("<d", barray)[0]) for barray in chunk(binaryRow, 8)]
+    return numpy.frombuffer(binaryRow, dtype="<f8").tolist()
 
 
 def packBinaryStrings(valueDict):
     """Converts a dictionary of lists of floats into a dictionary of lists of byte arrays."""
     bytearrays = {}
     for entry in valueDict:
-        bytearrays[entry] = [bytearray()]
-
-        for value in valueDict[entry]:
-            bytearrays[entry][0].extend(struct.pack("<d", value))
+        values = valueDict[entry]
+        if not isinstance(values, numpy.ndarray):
+            # generators, sets and dict views would become a 0-d object array
+            values = list(values)
+
+        values = numpy.asarray(values)
+        if values.ndim != 1:
+            raise TypeError(
+                "Can only pack a flat list of values for `{}` into binary strings: {}".format(
+                    entry, valueDict[entry]
+                )
+            )
+
+        if values.dtype.kind == "O" and all(hasattr(v, "__float__") for v in values):
+            # like struct.pack, accept any object that defines __float__, such as Decimal
+            values = numpy.array([float(v) for v in values])
+
+        if values.dtype.kind not in "biuf":
+            raise TypeError(
+                "Cannot pack non-numeric values for `{}` into binary strings: {}".format(
+                    entry, valueDict[entry]
+                )
+            )
+        bytearrays[entry] = [bytearray(values.astype("<f8").tobytes())]
 
     return bytearrays
 
 
 def unpackHexStrings(hexRow):
     """Unpacks a row of binary strings to a list of floats."""
-    return [float.fromhex(ss) for ss in hexRow.split() if ss != ""]
+    return list(map(float.fromhex, hexRow.split()))
 
 
 def packHexStrings(valueDict):
     """Converts a dictionary of lists of floats into a dictionary of lists of hex values arrays."""
     hexes = {}
     for entry in valueDict:
-        hexes[entry] = [" ".join(float.hex(float(value)) for value in valueDict[entry])]
+        hexes[entry] = [" ".join(map(float.hex, map(float, valueDict[entry])))]
     return hexes
 
 
@@ -13,18 +13,22 @@
 # limitations under the License.
 
 """Unittests for iterables.py."""
-import time
+from decimal import Decimal
 import unittest
 
-from armi.utils import iterables
+import numpy
 
-# CONSTANTS
-_TEST_DATA = {"turtle": [float(vv) for vv in range(-2000, 2000)]}
+from armi.utils import iterables
 
 
 class TestIterables(unittest.TestCase):
     """Testing our custom Iterables."""
 
+    @classmethod
+    def setUpClass(cls):
+        # data for the string packing round trips
+        cls.packData = {"turtle": numpy.arange(-2000.0, 2000.0).tolist()}
+
     def test_flatten(self):
         self.assertEqual(
             iterables.flatten([[1, 2, 3], [4, 5, 6], [7, 8], [9, 10]]),
@@ -35,12 +39,29 @@ class TestIterables(unittest.TestCase):
             [1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
         )
 
+    def test_flattenLarge(self):
+        flat = iterables.flatten([[0]] * 100000)
+        self.assertEqual(len(flat), 100000)
+        self.assertEqual(set(flat), {0})
+
+        # any iterable of iterables will do
+        self.assertEqual(
+            iterables.flatten(range(i) for i in range(4)), [0, 0, 1, 0, 1, 2]
+        )
+
     def test_chunk(self):
         self.assertEqual(
             list(iterables.chunk([1, 2, 3, 4, 5, 6, 7, 8, 9, 10], 4)),
             [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10]],
         )
 
+        # chunks of numpy arrays are views, not copies
+        arr = numpy.arange(10)
+        chunks = list(iterables.chunk(arr, 4))
+        self.assertEqual([len(c) for c in chunks], [4, 4, 2])
+        for c in chunks:
+            self.assertIs(c.base, arr)
+
     def test_split(self):
         data = list(range(50))
         chu = iterables.split(data, 10)
@@ -66,21 +87,68 @@ class TestIterables(unittest.TestCase):
         unchu = iterables.flatten(chu)
         self.assertEqual(unchu, data)
 
+        # numpy arrays are split into views, without copying the data
+        data = numpy.arange(50)
+        chu = iterables.split(data, 10)
+        self.assertEqual(len(chu), 10)
+        self.assertTrue(all(c.base is data for c in chu))
+        self.assertEqual(iterables.flatten(chu), data.tolist())
+
+        # short numpy arrays still get padded
+        chu = iterables.split(numpy.arange(3), 5, padWith=None)
+        self.assertEqual(len(chu), 5)
+        self.assertTrue(all(isinstance(c, numpy.ndarray) for c in chu[:3]))
+        self.assertEqual(chu[3:], [None, None])
+
+        # 2-D arrays are split into blocks of rows
+        data = numpy.arange(20).reshape(10, 2)
+        chu = iterables.split(data, 4)
+        self.assertEqual([c.shape for c in chu], [(3, 2), (3, 2), (2, 2), (2, 2)])
+        self.assertTrue(all(c.base is data.base for c in chu))
+        self.assertTrue((numpy.concatenate(chu) == data).all())
+
     def test_packingAndUnpackingBinaryStrings(self):
-        start = time.perf_counter()
-        packed = iterables.packBinaryStrings(_TEST_DATA)
+        packed = iterables.packBinaryStrings(self.packData)
         unpacked = iterables.unpackBinaryStrings(packed["turtle"][0])
-        timeDelta = time.perf_counter() - start
-        self.assertEqual(_TEST_DATA["turtle"], unpacked)
-        return timeDelta
+        self.assertEqual(self.packData["turtle"], unpacked)
+
+        # numpy arrays pack the same way as lists
+        packedArray = iterables.packBinaryStrings(
+            {"turtle": numpy.array(self.packData["turtle"])}
+        )
+        self.assertEqual(packed, packedArray)
+
+        # misformatted rows can not be unpacked
+        with self.assertRaises(ValueError):
+            iterables.unpackBinaryStrings(packed["turtle"][0][:-1])
+
+        # only flat lists of numeric values can be packed
+        for badValues in ([None, 1.0], ["1.5", 2.0], [[1.0, 2.0], [3.0, 4.0]], 1.0):
+            with self.assertRaises(TypeError):
+                iterables.packBinaryStrings({"turtle": badValues})
+
+        # any iterable of numbers packs like a list
+        packedGenerator = iterables.packBinaryStrings(
+            {"turtle": (v for v in self.packData["turtle"])}
+        )
+        self.assertEqual(packed, packedGenerator)
+
+        # objects that convert to float pack like the floats themselves
+        packedDecimals = iterables.packBinaryStrings({"turtle": [Decimal("1.5"), 2.0]})
+        self.assertEqual(
+            packedDecimals, iterables.packBinaryStrings({"turtle": [1.5, 2.0]})
+        )
 
     def test_packingAndUnpackingHexStrings(self):
-        start = time.perf_counter()
-        packed = iterables.packHexStrings(_TEST_DATA)
+        packed = iterables.packHexStrings(self.packData)
         unpacked = iterables.unpackHexStrings(packed["turtle"][0])
-        timeDelta = time.perf_counter() - start
-        self.assertEqual(_TEST_DATA["turtle"], unpacked)
-        return timeDelta
+        self.assertEqual(self.packData["turtle"], unpacked)
+
+        # numpy arrays pack the same way as lists
+        packedArray = iterables.packHexStrings(
+            {"turtle": numpy.array(self.packData["turtle"])}
+        )
+        self.assertEqual(packed, packedArray)
 
     def test_sequenceInit(self):
         # init an empty sequence
@@ -100,8 +168,14 @@ class TestIterables(unittest.TestCase):
         self.assertEqual(i, len(example))
 
     def test_sequence(self):
-        # sequentially using methods in the usual way
+        # the Sequence is lazy, so even a huge range is not loaded into memory
         s = iterables.Sequence(range(1000000))
+        self.assertNotIsInstance(s._iter, list)
+        s.drop(lambda i: i % 2 == 0)
+        self.assertEqual(next(s), 1)
+
+        # sequentially using methods in the usual way
+        s = iterables.Sequence(range(200))
         s.drop(lambda i: i % 2 == 0)
         s.select(lambda i: i < 20)
         s.transform(lambda i: i * 10)
@@ -109,7 +183,7 @@ class TestIterables(unittest.TestCase):
         self.assertEqual(result, (10, 30, 50, 70, 90, 110, 130, 150, 170, 190))
 
         # stringing together the methods in a more modern Python way
-        s = iterables.Sequence(range(1000000))
+        s = iterables.Sequence(range(200))
         result = tuple(
             s.drop(lambda i: i % 2 == 0)
             .select(lambda i: i < 20)
@@ -118,7 +192,7 @@ class TestIterables(unittest.TestCase):
         self.assertEqual(result, (10, 30, 50, 70, 90, 110, 130, 150, 170, 190))
 
         # call tuple() after a couple methods
-        s = iterables.Sequence(range(1000000))
+        s = iterables.Sequence(range(200))
         s.drop(lambda i: i % 2 == 0)
         s.select(lambda i: i < 20)
         result = tuple(s)